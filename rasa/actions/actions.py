@@ -1,91 +1,456 @@
-from typing import Any, Text, Dict, List
+from typing import Any, Text, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet
-import requests
+import asyncio
+import atexit
+import datetime
 import logging
+import logging.handlers
+import orjson
+import os
+import queue
+import re
+import threading
+import time
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Interaction analytics are written off the action path, in batches
+INTERACTION_LOG_FILE = os.getenv("INTERACTION_LOG_FILE", "logs/interactions.log")
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 5
+
+# Optional PostgreSQL DSN; when set, interactions are also bulk-inserted there
+INTERACTION_DB_URL = os.getenv("INTERACTION_DB_URL")
+# Connecting runs on the queue listener thread, so keep it short and back off on failure
+DB_CONNECT_TIMEOUT = 3
+DB_RECONNECT_COOLDOWN = 30
+
+def _flush_periodically(handlers: List[logging.Handler], stopped: threading.Event) -> None:
+    """Flush buffering handlers every LOG_FLUSH_INTERVAL seconds until stopped
+
+    Buffers flush themselves when full; this covers quiet periods, when no
+    new record arrives to trigger a flush.
+    """
+    while not stopped.wait(LOG_FLUSH_INTERVAL):
+        for handler in handlers:
+            handler.flush()
+
+class BatchingDBHandler(logging.Handler):
+    """Buffer interaction records and bulk-insert them into the analytics database
+
+    Rows are written with a single multi-row INSERT every `batch_size`
+    records, or earlier when the handler is flushed.
+    """
+
+    CREATE_SQL = """CREATE TABLE IF NOT EXISTS interactions (
+    id BIGSERIAL PRIMARY KEY,
+    user_id TEXT,
+    intent TEXT,
+    text TEXT,
+    ts TIMESTAMPTZ NOT NULL
+)"""
+    INSERT_SQL = "INSERT INTO interactions (user_id, intent, text, ts) VALUES %s"
+
+    def __init__(self, dsn: Text, batch_size: int = LOG_BATCH_SIZE):
+        super().__init__()
+        self.dsn = dsn
+        self.batch_size = batch_size
+        self._rows: List[Tuple[Any, ...]] = []
+        self._conn = None
+        self._reconnect_after = 0.0
+
+    @staticmethod
+    def _column(record: logging.LogRecord, field: Text) -> Optional[Text]:
+        # PostgreSQL text cannot hold NUL, and one bad row would fail the whole batch
+        value = getattr(record, field, None)
+        return value.replace("\x00", "") if isinstance(value, str) else value
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called with the handler lock held
+        self._rows.append((
+            self._column(record, "user_id"),
+            self._column(record, "intent"),
+            self._column(record, "text"),
+            datetime.datetime.fromtimestamp(record.created, tz=datetime.timezone.utc)
+        ))
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            rows, self._rows = self._rows, []
+            if rows:
+                self._insert(rows)
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        super().close()
+
+    def _insert(self, rows: List[Tuple[Any, ...]]) -> None:
+        if self._conn is None and time.monotonic() < self._reconnect_after:
+            logger.debug("Analytics database unavailable, dropped %d interaction records", len(rows))
+            return
+        try:
+            from psycopg2.extras import execute_values
+            if self._conn is None:
+                import psycopg2
+                self._conn = psycopg2.connect(self.dsn, connect_timeout=DB_CONNECT_TIMEOUT)
+                with self._conn.cursor() as cursor:
+                    cursor.execute(self.CREATE_SQL)
+                self._conn.commit()
+            with self._conn.cursor() as cursor:
+                execute_values(cursor, self.INSERT_SQL, rows, page_size=self.batch_size)
+            self._conn.commit()
+        except Exception as e:
+            # Analytics are best effort: drop the batch and reconnect after a cool-off
+            logger.warning("Dropped %d interaction records: %s", len(rows), e)
+            self._reconnect_after = time.monotonic() + DB_RECONNECT_COOLDOWN
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
+
+def _setup_interaction_logging() -> logging.Logger:
+    """Route interaction records through a queue drained by a background listener"""
+    log_dir = os.path.dirname(INTERACTION_LOG_FILE)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    file_handler = logging.FileHandler(INTERACTION_LOG_FILE)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+
+    handlers: List[logging.Handler] = [
+        logging.handlers.MemoryHandler(LOG_BATCH_SIZE, flushLevel=logging.ERROR, target=file_handler)
+    ]
+    if INTERACTION_DB_URL:
+        handlers.append(BatchingDBHandler(INTERACTION_DB_URL))
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # One timer thread drives the time-based flush for every batching handler
+    stopped = threading.Event()
+    threading.Thread(target=_flush_periodically, args=(handlers, stopped),
+                     name="interaction-log-flush", daemon=True).start()
+    atexit.register(stopped.set)
+
+    interaction_logger = logging.getLogger(f"{__name__}.interactions")
+    interaction_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    # Keep records off the synchronous handlers configured on the root logger
+    interaction_logger.propagate = False
+    # Analytics must not depend on the action server's console log level
+    interaction_logger.setLevel(logging.INFO)
+    return interaction_logger
+
+# Set up on first use so actions that never log interactions skip the file and thread
+_interaction_logger: Optional[logging.Logger] = None
+
+def _get_interaction_logger() -> logging.Logger:
+    """Return the queued interaction logger, setting it up on first use"""
+    global _interaction_logger
+    if _interaction_logger is None:
+        try:
+            _interaction_logger = _setup_interaction_logging()
+        except OSError as e:
+            # Don't fail the action over analytics; log through the module logger instead
+            logger.warning("Cannot open %s, logging interactions inline: %s", INTERACTION_LOG_FILE, e)
+            _interaction_logger = logger
+    return _interaction_logger
+
 # StreaminDoDo API base URL (should be configurable)
-API_BASE_URL = \"http://obs-multistream:3000/api\"
+API_BASE_URL = "http://obs-multistream:3000/api"
+STREAMS_URL = f"{API_BASE_URL}/streams"
+PLATFORMS_URL = f"{API_BASE_URL}/social/platforms"
+
+# Connection pool and retry settings for calls to the StreaminDoDo API
+HTTP_POOL_SIZE = 20
+HTTP_TIMEOUT = 5
+# Below Node's default 5s server keepAliveTimeout, so idle sockets are
+# dropped by us first instead of being reused just as the API closes them
+HTTP_KEEPALIVE_TIMEOUT = 4
+HTTP_MAX_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.1
+HTTP_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Stop calling the API for a cool-off period after consecutive failures
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN = 30
+
+# How long API responses are reused before hitting the API again (seconds)
+STREAMS_CACHE_TTL = 5
+PLATFORMS_CACHE_TTL = 30
+
+# Shared HTTP session, created lazily inside the action server's event loop
+_session: Optional["aiohttp.ClientSession"] = None
+
+# url -> (ETag, parsed JSON, expires_at) for successful responses
+_response_cache: Dict[Text, Tuple[Optional[Text], Any, float]] = {}
+# url -> in-flight refresh shared by every caller that missed the cache
+_refreshes: Dict[Text, "asyncio.Future[Tuple[int, Any]]"] = {}
+
+# Each of these intents leads to one API-backed action; prefetch just what it reads
+PREFETCH_TARGETS = {
+    "ask_streaming_status": (STREAMS_URL, STREAMS_CACHE_TTL),
+    "ask_platform_status": (PLATFORMS_URL, PLATFORMS_CACHE_TTL),
+}
+
+# Strong references to in-flight prefetches so they are not garbage collected
+_prefetch_tasks: Set["asyncio.Task[None]"] = set()
+
+# Shared by both endpoints, since they live on the same upstream service
+_breaker = {"failures": 0, "open_until": 0.0}
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit breaker is open"""
+
+def _record_failure() -> None:
+    """Count an API failure, opening the breaker once the threshold is hit"""
+    _breaker["failures"] += 1
+    if _breaker["failures"] >= BREAKER_FAILURE_THRESHOLD:
+        _breaker["open_until"] = time.monotonic() + BREAKER_COOLDOWN
+        logger.warning("StreaminDoDo API failed %d times in a row, pausing calls for %ds",
+                       _breaker["failures"], BREAKER_COOLDOWN)
+
+async def _get_session() -> "aiohttp.ClientSession":
+    """Return the shared aiohttp session, creating it on first use"""
+    global _session
+    # No await between the check and the assignment, so this is atomic on the loop
+    if _session is None or _session.closed:
+        # Imported here so the static actions don't pay for aiohttp at server start
+        import aiohttp
+        # Keep-alive connections are pooled by the connector and reused across actions
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_SIZE,
+            limit_per_host=HTTP_POOL_SIZE,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        )
+    return _session
+
+async def _get_json(url: Text,
+                    headers: Optional[Dict[Text, Text]] = None) -> Tuple[int, Any, Optional[Text]]:
+    """GET a JSON endpoint, retrying connection errors and gateway errors with backoff"""
+    import aiohttp
+    session = await _get_session()
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        last_attempt = attempt == HTTP_MAX_RETRIES
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status in HTTP_RETRY_STATUSES and not last_attempt:
+                    await asyncio.sleep(HTTP_RETRY_BACKOFF * (2 ** attempt))
+                    continue
+                data = orjson.loads(await response.read()) if response.status == 200 else None
+                return response.status, data, response.headers.get("ETag")
+        except asyncio.TimeoutError:
+            raise
+        except aiohttp.ClientConnectionError:
+            # Includes a pooled keep-alive socket closed by the server as it was reused.
+            # Timeouts are not retried, so a hung API still costs at most HTTP_TIMEOUT.
+            if last_attempt:
+                raise
+        await asyncio.sleep(HTTP_RETRY_BACKOFF * (2 ** attempt))
+
+async def _refresh(url: Text, ttl: float) -> Tuple[int, Any]:
+    """Fetch `url` from the API and update its cache entry"""
+    if time.monotonic() < _breaker["open_until"]:
+        raise CircuitOpenError(f"API calls suspended after {_breaker['failures']} failures")
+
+    cached = _response_cache.get(url)
+    etag = cached[0] if cached else None
+    headers = {"If-None-Match": etag} if etag else None
+    try:
+        status_code, data, new_etag = await _get_json(url, headers)
+    except Exception:
+        _record_failure()
+        raise
+
+    if status_code in (200, 304):
+        _breaker["failures"] = 0
+    else:
+        _record_failure()
+
+    if status_code == 304 and cached:
+        _response_cache[url] = (etag, cached[1], time.monotonic() + ttl)
+        return 200, cached[1]
+    if status_code == 200:
+        _response_cache[url] = (new_etag, data, time.monotonic() + ttl)
+    return status_code, data
+
+def _forget_refresh(url: Text, task: "asyncio.Future[Tuple[int, Any]]") -> None:
+    """Drop a finished refresh, marking its exception as retrieved"""
+    _refreshes.pop(url, None)
+    if not task.cancelled():
+        task.exception()
+
+async def _cached_get(url: Text, ttl: float) -> Tuple[int, Any]:
+    """GET a JSON endpoint, reusing a successful response for `ttl` seconds
+
+    Once an entry expires it is revalidated with If-None-Match, so an
+    unchanged resource costs a 304 instead of a full body and parse.
+    """
+    cached = _response_cache.get(url)
+    if cached and cached[2] > time.monotonic():
+        return 200, cached[1]
+
+    # Concurrent misses for the same URL share one upstream request and its outcome,
+    # so a failing API costs every waiter one timeout rather than one each in turn
+    refresh = _refreshes.get(url)
+    if refresh is None:
+        refresh = asyncio.ensure_future(_refresh(url, ttl))
+        _refreshes[url] = refresh
+        refresh.add_done_callback(lambda task: _forget_refresh(url, task))
+    # A cancelled waiter must not cancel the request the others are waiting on
+    return await asyncio.shield(refresh)
+
+async def prefetch_all() -> None:
+    """Warm the streams and platforms caches with concurrent requests
+
+    For stories that run both the status and platform actions in one turn.
+    """
+    results = await asyncio.gather(
+        _cached_get(STREAMS_URL, STREAMS_CACHE_TTL),
+        _cached_get(PLATFORMS_URL, PLATFORMS_CACHE_TTL),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug("Prefetch failed: %s", result)
+
+async def _prefetch(url: Text, ttl: float) -> None:
+    """Warm the cache for a single endpoint, ignoring failures"""
+    try:
+        await _cached_get(url, ttl)
+    except Exception as e:
+        logger.debug("Prefetch of %s failed: %s", url, e)
+
+def _schedule_prefetch(url: Text, ttl: float) -> None:
+    """Start a prefetch of `url` in the background without waiting for it"""
+    task = asyncio.ensure_future(_prefetch(url, ttl))
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_prefetch_tasks.discard)
+
+async def _close_session(*args: Any) -> None:
+    """Close the shared aiohttp session on action server shutdown"""
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+def _register_shutdown_hook() -> None:
+    """Attach the session cleanup to the rasa_sdk Sanic app, if it is running"""
+    try:
+        from sanic import Sanic
+        Sanic.get_app("rasa_sdk").register_listener(_close_session, "before_server_stop")
+    except Exception:
+        # Not running under `rasa run actions` (e.g. imported in a shell or tests)
+        logger.debug("rasa_sdk app not found, skipping HTTP session shutdown hook")
+
+_register_shutdown_hook()
 
 class ActionGetStreamStatus(Action):
-    \"\"\"Get current streaming status\"\"\"
+    """Get current streaming status"""
+    
+    ACTION_NAME = "action_get_stream_status"
     
     def name(self) -> Text:
-        return \"action_get_stream_status\"
+        return self.ACTION_NAME
     
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         
         try:
             # Get stream status from the main API
-            response = requests.get(f\"{API_BASE_URL}/streams\", timeout=5)
+            status_code, data = await _cached_get(STREAMS_URL, STREAMS_CACHE_TTL)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status_code == 200:
                 streams = data.get('data', [])
                 
                 if streams:
-                    active_count = len([s for s in streams if s.get('status') == 'active'])
-                    message = f\"🔴 Currently streaming live! {active_count} active stream(s) across multiple platforms.\"
+                    active_count = sum(s.get('status') == 'active' for s in streams)
+                    message = f"🔴 Currently streaming live! {active_count} active stream(s) across multiple platforms."
                 else:
-                    message = \"📺 No active streams at the moment. Check back later!\"
+                    message = "📺 No active streams at the moment. Check back later!"
             else:
-                message = \"⚠️ Unable to check stream status right now. Please try again later.\"
+                message = "⚠️ Unable to check stream status right now. Please try again later."
                 
-        except Exception as e:
-            logger.error(f\"Error getting stream status: {e}\")
-            message = \"❌ Error checking stream status. The streaming service might be unavailable.\"
+        except CircuitOpenError:
+            # Already reported when the breaker opened; skip the traceback per message
+            message = "❌ Error checking stream status. The streaming service might be unavailable."
+        except Exception:
+            logger.exception("Error getting stream status")
+            message = "❌ Error checking stream status. The streaming service might be unavailable."
         
         dispatcher.utter_message(text=message)
         return []
 
+# Platform status label, keyed by whether the platform is streaming
+_PLATFORM_STATUS = {True: "🟢 Live", False: "💬 Chat Only"}
+
 class ActionGetPlatformInfo(Action):
-    \"\"\"Get platform-specific information\"\"\"
+    """Get platform-specific information"""
+    
+    ACTION_NAME = "action_get_platform_info"
     
     def name(self) -> Text:
-        return \"action_get_platform_info\"
+        return self.ACTION_NAME
     
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         
         try:
             # Get platform status from social media API
-            response = requests.get(f\"{API_BASE_URL}/social/platforms\", timeout=5)
+            status_code, data = await _cached_get(PLATFORMS_URL, PLATFORMS_CACHE_TTL)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status_code == 200:
                 platforms = data.get('data', {})
                 
-                connected_platforms = []
-                for platform, info in platforms.items():
-                    if info.get('isConnected'):
-                        status = \"🟢 Live\" if info.get('isStreaming') else \"💬 Chat Only\"
-                        connected_platforms.append(f\"{platform.title()}: {status}\")
+                connected_platforms = [
+                    f"{platform.title()}: {_PLATFORM_STATUS[bool(info.get('isStreaming'))]}"
+                    for platform, info in platforms.items()
+                    if info.get('isConnected')
+                ]
                 
                 if connected_platforms:
-                    message = f\"🌐 Platform Status:\n\" + \"\n\".join(connected_platforms)
+                    message = f"🌐 Platform Status:\n" + "\n".join(connected_platforms)
                 else:
-                    message = \"📱 No platforms currently connected.\"
+                    message = "📱 No platforms currently connected."
             else:
-                message = \"⚠️ Unable to check platform status right now.\"
+                message = "⚠️ Unable to check platform status right now."
                 
-        except Exception as e:
-            logger.error(f\"Error getting platform info: {e}\")
-            message = \"❌ Error checking platform information.\"
+        except CircuitOpenError:
+            # Already reported when the breaker opened; skip the traceback per message
+            message = "❌ Error checking platform information."
+        except Exception:
+            logger.exception("Error getting platform info")
+            message = "❌ Error checking platform information."
         
         dispatcher.utter_message(text=message)
         return []
 
 class ActionGetViewerCount(Action):
-    \"\"\"Get current viewer count across platforms\"\"\"
+    """Get current viewer count across platforms"""
+    
+    ACTION_NAME = "action_get_viewer_count"
     
     def name(self) -> Text:
-        return \"action_get_viewer_count\"
+        return self.ACTION_NAME
     
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
@@ -93,125 +458,154 @@ class ActionGetViewerCount(Action):
         
         # Note: This would require implementation of viewer tracking
         # For now, return a placeholder message
-        message = \"👥 Viewer count tracking is being implemented. Stay tuned!\"
+        message = "👥 Viewer count tracking is being implemented. Stay tuned!"
         dispatcher.utter_message(text=message)
         return []
 
+# Static replies for the informational actions
+_SOCIAL_LINKS_MSG = """🌐 Follow us on all platforms:
+
+🎮 Twitch: /streamindodo
+📺 YouTube: /streamindodo
+🐦 Twitter: @streamindodo
+💬 Discord: discord.gg/streamindodo
+📸 Instagram: @streamindodo
+📱 TikTok: @streamindodo
+💼 LinkedIn: /company/streamindodo
+📢 Telegram: t.me/streamindodo
+
+Thanks for your support! 💖"""
+
+_SCHEDULE_MSG = """📅 Streaming Schedule:
+
+🌅 Monday-Friday: 9 AM - 12 PM (UTC)
+🌆 Saturday-Sunday: 2 PM - 6 PM (UTC)
+
+🎯 Special events and announcements will be posted on all social media platforms!
+
+⏰ Current time zone: UTC
+📢 Follow us for schedule updates!"""
+
+_FEEDBACK_MSG = """📝 We'd love your feedback!
+
+Please let us know:
+• What you enjoy about the stream
+• Any technical issues you've experienced
+• Content suggestions
+• Platform preferences
+
+Just type your feedback and I'll make sure it gets to the team! 💬"""
+
+# Troubleshooting replies, keyed by the keyword that triggers them
+_LAG_MSG = "🔧 For buffering/lag issues:\n• Refresh the stream\n• Try a lower quality setting\n• Check your internet connection\n• Clear browser cache"
+_AUDIO_MSG = "🔊 For audio issues:\n• Check your volume settings\n• Try refreshing the page\n• Ensure your browser allows audio\n• Try a different browser"
+_VIDEO_MSG = "📺 For video issues:\n• Refresh the stream\n• Try a different quality setting\n• Check if hardware acceleration is enabled\n• Update your browser"
+_GENERIC_MSG = "🛠️ General troubleshooting:\n• Refresh the page\n• Clear browser cache\n• Try a different browser\n• Check your internet connection\n\nIf issues persist, contact a moderator!"
+
+_ISSUE_MAP = {
+    "lag": _LAG_MSG,
+    "buffer": _LAG_MSG,
+    "audio": _AUDIO_MSG,
+    "sound": _AUDIO_MSG,
+    "video": _VIDEO_MSG,
+}
+_ISSUE_RE = re.compile("|".join(_ISSUE_MAP), re.IGNORECASE)
+
 class ActionHandleTechnicalIssue(Action):
-    \"\"\"Handle technical support requests\"\"\"
+    """Handle technical support requests"""
+    
+    ACTION_NAME = "action_handle_technical_issue"
     
     def name(self) -> Text:
-        return \"action_handle_technical_issue\"
+        return self.ACTION_NAME
     
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         
         # Get the latest user message to understand the issue
-        latest_message = tracker.latest_message.get('text', '').lower()
+        latest_message = tracker.latest_message.get('text', '')
         
-        if 'lag' in latest_message or 'buffer' in latest_message:
-            message = \"🔧 For buffering/lag issues:\n• Refresh the stream\n• Try a lower quality setting\n• Check your internet connection\n• Clear browser cache\"
-        elif 'audio' in latest_message or 'sound' in latest_message:
-            message = \"🔊 For audio issues:\n• Check your volume settings\n• Try refreshing the page\n• Ensure your browser allows audio\n• Try a different browser\"
-        elif 'video' in latest_message:
-            message = \"📺 For video issues:\n• Refresh the stream\n• Try a different quality setting\n• Check if hardware acceleration is enabled\n• Update your browser\"
-        else:
-            message = \"🛠️ General troubleshooting:\n• Refresh the page\n• Clear browser cache\n• Try a different browser\n• Check your internet connection\n\nIf issues persist, contact a moderator!\"
+        match = _ISSUE_RE.search(latest_message)
+        message = _ISSUE_MAP[match.group(0).lower()] if match else _GENERIC_MSG
         
         dispatcher.utter_message(text=message)
         return []
 
 class ActionGetSocialLinks(Action):
-    \"\"\"Provide social media links\"\"\"
+    """Provide social media links"""
+    
+    ACTION_NAME = "action_get_social_links"
     
     def name(self) -> Text:
-        return \"action_get_social_links\"
+        return self.ACTION_NAME
     
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         
-        message = \"\"\"🌐 Follow us on all platforms:
-
-🎮 Twitch: /streamindodo
-📺 YouTube: /streamindodo
-🐦 Twitter: @streamindodo
-💬 Discord: discord.gg/streamindodo
-📸 Instagram: @streamindodo
-📱 TikTok: @streamindodo
-💼 LinkedIn: /company/streamindodo
-📢 Telegram: t.me/streamindodo
-
-Thanks for your support! 💖\"\"\"
-        
-        dispatcher.utter_message(text=message)
+        dispatcher.utter_message(text=_SOCIAL_LINKS_MSG)
         return []
 
 class ActionGetStreamSchedule(Action):
-    \"\"\"Provide streaming schedule information\"\"\"
+    """Provide streaming schedule information"""
+    
+    ACTION_NAME = "action_get_stream_schedule"
     
     def name(self) -> Text:
-        return \"action_get_stream_schedule\"
+        return self.ACTION_NAME
     
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         
-        message = \"\"\"📅 Streaming Schedule:
-
-🌅 Monday-Friday: 9 AM - 12 PM (UTC)
-🌆 Saturday-Sunday: 2 PM - 6 PM (UTC)
-
-🎯 Special events and announcements will be posted on all social media platforms!
-
-⏰ Current time zone: UTC
-📢 Follow us for schedule updates!\"\"\"
-        
-        dispatcher.utter_message(text=message)
+        dispatcher.utter_message(text=_SCHEDULE_MSG)
         return []
 
 class ActionLogUserInteraction(Action):
-    \"\"\"Log user interaction for analytics\"\"\"
+    """Log user interaction for analytics"""
+    
+    ACTION_NAME = "action_log_user_interaction"
     
     def name(self) -> Text:
-        return \"action_log_user_interaction\"
+        return self.ACTION_NAME
     
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         
         # Extract user info and interaction data
         user_id = tracker.sender_id
-        latest_intent = tracker.latest_message.get('intent', {}).get('name')
-        latest_message = tracker.latest_message.get('text', '')
+        message = tracker.latest_message
+        latest_intent = message.get('intent', {}).get('name')
+        latest_message = message.get('text', '')
+        
+        # Log the interaction; the structured fields feed the analytics database
+        _get_interaction_logger().info(
+            "User interaction - ID: %s, Intent: %s, Message: %s",
+            user_id, latest_intent, latest_message,
+            extra={"user_id": user_id, "intent": latest_intent, "text": latest_message}
+        )
         
-        # Log the interaction (in a real implementation, this would go to a database)
-        logger.info(f\"User interaction - ID: {user_id}, Intent: {latest_intent}, Message: {latest_message}\")
+        # Warm the API caches so status/platform actions later in the turn are cache hits
+        if latest_intent in PREFETCH_TARGETS:
+            _schedule_prefetch(*PREFETCH_TARGETS[latest_intent])
         
         # Set user activity slot
-        return [SlotSet(\"last_interaction\", latest_intent)]
+        return [SlotSet("last_interaction", latest_intent)]
 
 # Custom form action for feedback collection
 class ActionCollectFeedback(Action):
-    \"\"\"Collect user feedback\"\"\"
+    """Collect user feedback"""
+    
+    ACTION_NAME = "action_collect_feedback"
     
     def name(self) -> Text:
-        return \"action_collect_feedback\"
+        return self.ACTION_NAME
     
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         
-        message = \"\"\"📝 We'd love your feedback!
-
-Please let us know:
-• What you enjoy about the stream
-• Any technical issues you've experienced
-• Content suggestions
-• Platform preferences
-
-Just type your feedback and I'll make sure it gets to the team! 💬\"\"\"
-        
-        dispatcher.utter_message(text=message)
-        return [SlotSet(\"collecting_feedback\", True)]
\ No newline at end of file
+        dispatcher.utter_message(text=_FEEDBACK_MSG)
+        return [SlotSet("collecting_feedback", True)]
\ No newline at end of file